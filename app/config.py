@@ -22,6 +22,14 @@ class Settings(BaseSettings):
     # Limits
     max_video_duration_seconds: int = 7200  # 2 hours max
 
+    # Parent directory for per-request audio downloads. Empty = /dev/shm when
+    # it has room (RAM-backed, no SSD writes), else the system temp dir
+    audio_tmp_root: str = ""
+
+    # Directory for the on-disk YouTube metadata cache (one JSON file per video,
+    # shareable between instances via a mount). Empty = in-memory cache only
+    metadata_cache_dir: str = ""
+
     # yt-dlp sleep intervals (low values are fine for single-video requests)
     ytdlp_sleep_interval: int = 0
     ytdlp_max_sleep_interval: int = 2
@@ -1,3 +1,4 @@
+import asyncio
 import http.cookiejar
 import logging
 import os
@@ -13,6 +14,7 @@ from app.services.youtube import (
     get_video_metadata,
     get_metadata_via_ytdlp,
     is_valid_youtube_url,
+    youtube_thumbnail_url,
     COOKIES_FILE,
 )
 
@@ -23,12 +25,21 @@ logger = logging.getLogger(__name__)
 @router.get("/metadata", response_model=MetadataResponse)
 async def get_metadata(
     video_url: str = Query(..., description="Video URL (YouTube or Twitter/X)"),
+    fast: bool = Query(False, description="YouTube only: skip yt-dlp and return oEmbed data (no duration)"),
+    max_wait: float | None = Query(
+        None,
+        gt=0,
+        description="YouTube only: if yt-dlp takes longer than this many seconds, return oEmbed data (no duration)",
+    ),
 ) -> MetadataResponse:
     """
     Get video metadata without downloading.
 
     Supports YouTube and Twitter/X URLs.
     Returns video title, channel name, thumbnail URL, duration, etc.
+    With fast=true, YouTube metadata comes from oEmbed only (single HTTP
+    request) and duration is 0. With max_wait, yt-dlp is tried first and
+    oEmbed answers instead if it hasn't finished in time.
     """
     # Validate URL
     if not is_valid_video_url(video_url):
@@ -37,12 +48,20 @@ async def get_metadata(
     platform = detect_platform(video_url)
 
     try:
+        # Both lookups block for seconds; run them off the event loop
         # Twitter/X: use yt-dlp for metadata
         if platform == "twitter":
-            metadata = get_metadata_via_ytdlp(video_url)
+            metadata = await asyncio.to_thread(get_metadata_via_ytdlp, video_url)
         else:
             # YouTube: existing logic (yt-dlp → oEmbed fallback)
-            metadata = get_video_metadata(video_url)
+            metadata = await asyncio.to_thread(
+                get_video_metadata, video_url, prefer_fast=fast, ytdlp_deadline=max_wait
+            )
+
+        # YouTube metadata only carries the full-size thumbnail; derive the small one
+        thumbnail_small = metadata.get("thumbnail_small")
+        if thumbnail_small is None and platform == "youtube":
+            thumbnail_small = youtube_thumbnail_url(metadata["video_id"], "hqdefault")
 
         return MetadataResponse(
             success=True,
@@ -51,7 +70,7 @@ async def get_metadata(
                 title=metadata["title"],
                 channel_name=metadata["channel_name"],
                 thumbnail=metadata.get("thumbnail", ""),
-                thumbnail_small=metadata.get("thumbnail_small"),
+                thumbnail_small=thumbnail_small,
                 duration=metadata.get("duration", 0),
                 view_count=metadata.get("view_count"),
                 upload_date=metadata.get("upload_date"),
@@ -1,9 +1,6 @@
 import asyncio
 import json
 import logging
-import os
-import shutil
-import tempfile
 
 from fastapi import APIRouter, HTTPException
 from fastapi.responses import StreamingResponse
@@ -35,6 +32,9 @@ from app.services.youtube import (
     download_audio_twitter,
     get_metadata_via_ytdlp,
     _get_metadata_via_oembed,
+    make_audio_dir,
+    cleanup_audio_dir,
+    youtube_thumbnail_url,
 )
 
 router = APIRouter()
@@ -70,7 +70,7 @@ async def transcribe_video(request: TranscribeRequest) -> TranscribeResponse:
 
         # === Twitter/X path ===
         if platform == "twitter":
-            temp_dir = tempfile.mkdtemp()
+            temp_dir = make_audio_dir()
 
             # Get metadata via yt-dlp
             try:
@@ -165,7 +165,7 @@ async def transcribe_video(request: TranscribeRequest) -> TranscribeResponse:
                 "video_id": video_id,
                 "title": "Unknown",
                 "channel_name": "Unknown",
-                "thumbnail": f"https://img.youtube.com/vi/{video_id}/maxresdefault.jpg",
+                "thumbnail": youtube_thumbnail_url(video_id),
                 "duration": result.audio_duration or 0,
             }
 
@@ -209,12 +209,12 @@ async def transcribe_video(request: TranscribeRequest) -> TranscribeResponse:
             "video_id": video_id,
             "title": "Unknown",
             "channel_name": "Unknown",
-            "thumbnail": f"https://img.youtube.com/vi/{video_id}/maxresdefault.jpg",
+            "thumbnail": youtube_thumbnail_url(video_id),
             "duration": 0,
         }
 
         # Create temp directory for audio download
-        temp_dir = tempfile.mkdtemp()
+        temp_dir = make_audio_dir()
 
         # Get transcript using Tier 2/3/4 (skip Tier 1 since it already failed)
         try:
@@ -282,8 +282,7 @@ async def transcribe_video(request: TranscribeRequest) -> TranscribeResponse:
 
     finally:
         # Always clean up temp directory
-        if temp_dir and os.path.exists(temp_dir):
-            shutil.rmtree(temp_dir, ignore_errors=True)
+        cleanup_audio_dir(temp_dir)
 
 
 @router.post("/transcribe/stream")
@@ -307,7 +306,7 @@ async def transcribe_video_stream(request: TranscribeRequest):
 
             # === Twitter/X streaming path ===
             if platform == "twitter":
-                temp_dir = tempfile.mkdtemp()
+                temp_dir = make_audio_dir()
 
                 # Fetch metadata via yt-dlp
                 try:
@@ -432,7 +431,7 @@ async def transcribe_video_stream(request: TranscribeRequest):
                     "video_id": video_id,
                     "title": "Unknown",
                     "channel_name": "Unknown",
-                    "thumbnail": f"https://img.youtube.com/vi/{video_id}/maxresdefault.jpg",
+                    "thumbnail": youtube_thumbnail_url(video_id),
                     "duration": result.audio_duration or 0,
                 }
 
@@ -469,11 +468,11 @@ async def transcribe_video_stream(request: TranscribeRequest):
                 "video_id": video_id,
                 "title": "Unknown",
                 "channel_name": "Unknown",
-                "thumbnail": f"https://img.youtube.com/vi/{video_id}/maxresdefault.jpg",
+                "thumbnail": youtube_thumbnail_url(video_id),
                 "duration": 0,
             }
 
-            temp_dir = tempfile.mkdtemp()
+            temp_dir = make_audio_dir()
             normalized_url = f"https://www.youtube.com/watch?v={video_id}"
 
             # Try yt-dlp, then pytubefix
@@ -691,8 +690,7 @@ async def transcribe_video_stream(request: TranscribeRequest):
             yield _format_sse("error", {"error": str(e), "phase": "transcription"})
 
         finally:
-            if temp_dir and os.path.exists(temp_dir):
-                shutil.rmtree(temp_dir, ignore_errors=True)
+            cleanup_audio_dir(temp_dir)
 
     return StreamingResponse(
         event_generator(),
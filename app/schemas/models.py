@@ -1,41 +1,16 @@
-import re
 from typing import Any, Literal
 
 from pydantic import BaseModel, field_validator
 
-
-# YouTube URL patterns for validation
-YOUTUBE_URL_PATTERNS = [
-    r"^(https?://)?(www\.)?youtube\.com/watch\?v=([a-zA-Z0-9_-]{11})",
-    r"^(https?://)?(www\.)?youtu\.be/([a-zA-Z0-9_-]{11})",
-    r"^(https?://)?(www\.)?youtube\.com/embed/([a-zA-Z0-9_-]{11})",
-    r"^(https?://)?(www\.)?youtube\.com/v/([a-zA-Z0-9_-]{11})",
-    r"^(https?://)?(www\.)?youtube\.com/shorts/([a-zA-Z0-9_-]{11})",
-    r"^[a-zA-Z0-9_-]{11}$",  # Just the video ID
-]
-
-# Twitter/X URL patterns for validation
-TWITTER_URL_PATTERNS = [
-    r"^(https?://)?(www\.)?(twitter\.com|x\.com)/.+/status/\d+",
-    r"^https?://t\.co/.+",
-]
-
-
-def is_valid_youtube_url(url: str) -> bool:
-    """Check if URL is a valid YouTube URL or video ID."""
-    for pattern in YOUTUBE_URL_PATTERNS:
-        if re.match(pattern, url):
-            return True
-    # Also check for v= parameter
-    if "v=" in url and re.search(r"v=([a-zA-Z0-9_-]{11})", url):
-        return True
-    return False
+# URL patterns live in the YouTube service so validation and ID extraction
+# can't drift apart
+from app.services.youtube import TWITTER_URL_PATTERNS, is_valid_youtube_url
 
 
 def is_valid_twitter_url(url: str) -> bool:
     """Check if URL is a valid Twitter/X video URL."""
     for pattern in TWITTER_URL_PATTERNS:
-        if re.match(pattern, url):
+        if pattern.match(url):
             return True
     return False
 
@@ -10,9 +10,11 @@ This eliminates the need for daily cookie updates since Tier 1 doesn't require a
 import logging
 import os
 import http.cookiejar
+import threading
 import requests
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 from typing import Any
 
 import assemblyai as aai
@@ -39,6 +41,8 @@ from app.services.youtube import (
     YouTubeRateLimitError,
     YouTubeCookiesRequiredError,
     COOKIES_FILE,
+    _file_version,
+    _is_innertube_context_error,
 )
 from app.services.retry import retry_with_backoff, is_retryable_error
 from app.services.transcription import transcribe_audio, TranscriptionError, init_assemblyai
@@ -123,6 +127,7 @@ def _estimate_duration_from_transcript(snippets: list[dict]) -> int | None:
     return int(end_time)
 
 
+@lru_cache()
 def _get_webshare_proxy_config() -> WebshareProxyConfig | None:
     """
     Get Webshare rotating residential proxy configuration.
@@ -137,6 +142,7 @@ def _get_webshare_proxy_config() -> WebshareProxyConfig | None:
     return None
 
 
+@lru_cache()
 def _get_proxy_config() -> GenericProxyConfig | None:
     """
     Get residential proxy configuration for youtube-transcript-api.
@@ -151,6 +157,7 @@ def _get_proxy_config() -> GenericProxyConfig | None:
     return None
 
 
+@lru_cache()
 def _get_tor_proxy_config() -> GenericProxyConfig | None:
     """
     Get Tor proxy configuration for youtube-transcript-api.
@@ -165,34 +172,53 @@ def _get_tor_proxy_config() -> GenericProxyConfig | None:
     return None
 
 
-def _get_http_client() -> requests.Session | None:
+def _load_cookie_jar() -> http.cookiejar.CookieJar:
     """
-    Create a requests Session with cookies if available.
+    Load cookies.txt for youtube-transcript-api sessions (empty jar if unavailable).
     """
     if not os.path.exists(COOKIES_FILE):
-        return None
+        return requests.cookies.RequestsCookieJar()
 
     try:
-        session = requests.Session()
         cj = http.cookiejar.MozillaCookieJar(COOKIES_FILE)
         cj.load(ignore_discard=True, ignore_expires=True)
-        session.cookies = cj
-        return session
+        return cj
     except Exception as e:
         logger.warning(f"Failed to load cookies for youtube-transcript-api: {e}")
-        return None
+        return requests.cookies.RequestsCookieJar()
 
 
-def _is_innertube_context_error(error_msg: str) -> bool:
-    """Detect yt-dlp extractor errors related to missing INNERTUBE_CONTEXT."""
-    error_lower = error_msg.lower()
-    return (
-        "innertube_context" in error_lower
-        or "extractor error" in error_lower
-        or "failed to extract" in error_lower
-        or "initial player response" in error_lower
-        or "player response" in error_lower
-    )
+# Per-thread YouTubeTranscriptApi instances (the library is not thread-safe)
+_ytt_local = threading.local()
+
+
+def _get_ytt_api(proxy_config: GenericProxyConfig | None) -> YouTubeTranscriptApi:
+    """
+    Get a reusable YouTubeTranscriptApi for the given proxy config.
+
+    Instances are cached per worker thread and keyed on the (cached) proxy
+    config object, so each stage keeps its own requests.Session and warm
+    connection pool across requests. When cookies.txt changes (an operator
+    hot update, or yt-dlp saving its jar on close) only the sessions' cookie
+    jars are reloaded; the instances and their connections are kept.
+    """
+    if not hasattr(_ytt_local, "apis"):
+        _ytt_local.apis = {}
+        _ytt_local.cookies_version = None
+
+    version = _file_version(COOKIES_FILE)
+    if _ytt_local.cookies_version != version:
+        _ytt_local.cookies_version = version
+        for _, session in _ytt_local.apis.values():
+            session.cookies = _load_cookie_jar()
+
+    cached = _ytt_local.apis.get(proxy_config)
+    if cached is None:
+        session = requests.Session()
+        session.cookies = _load_cookie_jar()
+        ytt = YouTubeTranscriptApi(proxy_config=proxy_config, http_client=session)
+        cached = _ytt_local.apis[proxy_config] = (ytt, session)
+    return cached[0]
 
 
 def _try_fetch_captions(
@@ -206,17 +232,10 @@ def _try_fetch_captions(
     Returns:
         Tuple of (transcript object, description string for logging)
     """
-    http_client = _get_http_client()
     proxy_config = _get_proxy_config() if use_proxy else None
 
-    kwargs = {}
-    if http_client:
-        kwargs["http_client"] = http_client
-    if proxy_config:
-        kwargs["proxy_config"] = proxy_config
-
     desc = "with proxy" if proxy_config else "without proxy"
-    ytt = YouTubeTranscriptApi(**kwargs)
+    ytt = _get_ytt_api(proxy_config)
     transcript = ytt.fetch(video_id, languages=languages)
     return transcript, desc
 
@@ -232,13 +251,8 @@ def _try_fetch_captions_with_config(
     Returns:
         Tuple of (transcript object, description string for logging)
     """
-    kwargs = {"proxy_config": proxy_config}
-    http_client = _get_http_client()
-    if http_client:
-        kwargs["http_client"] = http_client
-
     desc = "with Tor" if "socks" in str(getattr(proxy_config, "https_url", "")) else "with proxy"
-    ytt = YouTubeTranscriptApi(**kwargs)
+    ytt = _get_ytt_api(proxy_config)
     transcript = ytt.fetch(video_id, languages=languages)
     return transcript, desc
 
@@ -1,18 +1,39 @@
+import atexit
+import concurrent.futures
+import contextlib
+import email.utils
+import hashlib
 import logging
+import math
+import mmap
 import os
+import random
 import re
+import shutil
 import socket
 import tempfile
-import urllib.request
-import urllib.error
+import threading
+import time
 import json
-from typing import Any
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+from collections import ChainMap, OrderedDict
+from collections.abc import Callable, Iterator, Mapping
+from typing import TYPE_CHECKING, Any, TypeVar
 
-import yt_dlp
-from app.config import get_settings
+import httpx
+import orjson
+from app.config import Settings, get_settings
+
+# yt_dlp pulls in hundreds of extractor modules; it is imported inside the
+# functions that use it so workers that never touch it don't pay for it
+if TYPE_CHECKING:
+    import yt_dlp
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 class YouTubeError(Exception):
     """Base exception for YouTube-related errors."""
@@ -56,6 +77,20 @@ class YouTubeCookiesRequiredError(YouTubeError):
     pass
 
 
+def _stat_or_none(path: str) -> os.stat_result | None:
+    """os.stat() that returns None instead of raising for missing files."""
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
+
+def _file_version(path: str) -> tuple[int, int] | None:
+    """(mtime_ns, size) of path, or None if it doesn't exist."""
+    st = _stat_or_none(path)
+    return (st.st_mtime_ns, st.st_size) if st is not None else None
+
+
 # Get the cookies file path
 # In Docker container, it's at /app/cookies.txt
 # Locally, it's relative to project root
@@ -63,29 +98,71 @@ _project_root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
 COOKIES_FILE = os.path.join(_project_root, "cookies.txt")
 
 # Also check /app/cookies.txt for Docker container
-if not os.path.exists(COOKIES_FILE) and os.path.exists("/app/cookies.txt"):
+if _stat_or_none(COOKIES_FILE) is None and _stat_or_none("/app/cookies.txt") is not None:
     COOKIES_FILE = "/app/cookies.txt"
 
 
+# Last cookies validation as one ((path, mtime_ns, size), valid) tuple, so a
+# reader never pairs a new key with the previous file's result, plus the
+# last (path, exists, valid) state that was logged
+_COOKIES_CACHE: dict[str, Any] = {"result": None, "logged": None}
+
+
 def _has_youtube_cookies(cookie_file: str) -> bool:
-    """Check if cookie file contains valid YouTube authentication cookies."""
-    if not os.path.exists(cookie_file):
-        return False
+    """
+    Check if cookie file contains valid YouTube authentication cookies.
+
+    The result is cached until the file's mtime or size changes, so the file
+    is only re-scanned after a hot update rather than on every request.
+    The cookies status is logged on first use and whenever it changes.
+    """
+    st = _stat_or_none(cookie_file)
+    valid = _validate_cookies_from_stat(cookie_file, st) if st is not None else False
+
+    state = (cookie_file, st is not None, valid)
+    if _COOKIES_CACHE["logged"] != state:
+        _COOKIES_CACHE["logged"] = state
+        logger.info("[youtube] Cookies file: %s, exists: %s, valid: %s", *state)
+    return valid
+
+
+def _validate_cookies_from_stat(cookie_file: str, st: os.stat_result) -> bool:
+    """Validate cookie_file given its stat result, reusing the cached answer if unchanged."""
+    key = (cookie_file, st.st_mtime_ns, st.st_size)
+    cached = _COOKIES_CACHE["result"]
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    valid = False
     try:
-        with open(cookie_file, 'r') as f:
-            content = f.read()
+        with open(cookie_file, "rb") as f:
             # Check for YouTube domain AND essential auth cookies
             # Cookies must be for .youtube.com domain with SAPISID (the key auth cookie)
-            has_youtube_domain = '.youtube.com' in content
-            has_sapisid = 'SAPISID' in content
-            return has_youtube_domain and has_sapisid
+            try:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    valid = mm.find(b".youtube.com") != -1 and mm.find(b"SAPISID") != -1
+            except (ValueError, OSError):
+                # Empty or non-mappable (pipe, some bind mounts): stream it instead
+                f.seek(0)
+                valid = _scan_cookie_lines(f)
     except Exception:
         return False
 
+    _COOKIES_CACHE["result"] = (key, valid)
+    return valid
 
-_cookies_exist = os.path.exists(COOKIES_FILE)
-_cookies_valid = _has_youtube_cookies(COOKIES_FILE) if _cookies_exist else False
-print(f"[youtube] Cookies file: {COOKIES_FILE}, exists: {_cookies_exist}, valid: {_cookies_valid}")
+
+def _scan_cookie_lines(f) -> bool:
+    """Line-by-line cookie check that stops as soon as both markers are seen."""
+    has_domain = has_sapisid = False
+    for line in f:
+        if not has_domain and b".youtube.com" in line:
+            has_domain = True
+        if not has_sapisid and b"SAPISID" in line:
+            has_sapisid = True
+        if has_domain and has_sapisid:
+            return True
+    return False
 
 
 def _cookies_valid_now() -> bool:
@@ -93,45 +170,167 @@ def _cookies_valid_now() -> bool:
     return _has_youtube_cookies(COOKIES_FILE)
 
 
+# Error-message token matchers, compiled once. IGNORECASE avoids a .lower()
+# copy of (often multi-KB) yt-dlp error messages and each scans in one pass.
+_PROXY_ERROR_RE = re.compile(r"proxy|tunnel connection failed|(?<!\S)407(?!\S)", re.IGNORECASE)
+_INNERTUBE_ERROR_RE = re.compile(
+    r"innertube_context|extractor error|failed to extract|player response", re.IGNORECASE
+)
+_PRIVATE_ERROR_RE = re.compile(r"private", re.IGNORECASE)
+_NOT_FOUND_ERROR_RE = re.compile(r"not found|404", re.IGNORECASE)
+_UNAVAILABLE_ERROR_RE = re.compile(r"private|unavailable", re.IGNORECASE)
+_PROTECTED_ERROR_RE = re.compile(r"private|protected", re.IGNORECASE)
+_BLOCKED_ERROR_RE = re.compile(r"sign in|bot", re.IGNORECASE)
+_BOT_CHECK_ERROR_RE = re.compile(r"sign in|bot|cookies", re.IGNORECASE)
+_MISSING_ERROR_RE = re.compile(r"unavailable|not found", re.IGNORECASE)
+
+
 def _is_proxy_error(error_msg: str) -> bool:
     """Detect proxy-related failures in yt-dlp/pytube errors."""
-    error_lower = error_msg.lower()
-    return (
-        "proxy" in error_lower
-        or "tunnel connection failed" in error_lower
-        or "proxy authentication required" in error_lower
-        or " 407 " in f" {error_lower} "
-    )
+    return _PROXY_ERROR_RE.search(error_msg) is not None
 
 
 def _is_innertube_context_error(error_msg: str) -> bool:
     """Detect yt-dlp extractor errors related to missing INNERTUBE_CONTEXT."""
-    error_lower = error_msg.lower()
-    return (
-        "innertube_context" in error_lower
-        or "extractor error" in error_lower
-        or "failed to extract" in error_lower
-        or "initial player response" in error_lower
-        or "player response" in error_lower
-    )
+    return _INNERTUBE_ERROR_RE.search(error_msg) is not None
 
 
-def _ydl_opts_without_proxy(ydl_opts: dict) -> dict:
-    """Return a copy of yt-dlp opts with proxies explicitly disabled."""
-    opts = dict(ydl_opts)
+def _ydl_opts_without_proxy(ydl_opts: Mapping[str, Any]) -> ChainMap:
+    """Return a view of yt-dlp opts with proxies explicitly disabled."""
     # yt-dlp treats empty string as "no proxy"
-    opts["proxy"] = ""
-    return opts
+    return ChainMap({"proxy": ""}, ydl_opts)
 
 
-def _ydl_opts_without_cookies(ydl_opts: dict) -> dict:
-    """Return a copy of yt-dlp opts with cookies disabled."""
-    opts = dict(ydl_opts)
-    opts["cookiefile"] = None
-    return opts
+def _ydl_opts_without_cookies(ydl_opts: Mapping[str, Any]) -> ChainMap:
+    """Return a view of yt-dlp opts with cookies disabled."""
+    return ChainMap({"cookiefile": None}, ydl_opts)
+
+
+def _ydl_opts_with_webshare(ydl_opts: Mapping[str, Any], settings: Settings) -> ChainMap:
+    """Return a view of yt-dlp opts routed through Webshare, without cookies."""
+    return ChainMap({"proxy": settings.webshare_http_proxy_url, "cookiefile": None}, ydl_opts)
+
+
+def _ydl_attempts(
+    base_opts: Mapping[str, Any], settings: Settings
+) -> Iterator[tuple[str, Callable[[str], bool] | None, Mapping[str, Any]]]:
+    """
+    Yield the yt-dlp option variants to try, in order.
+
+    Each entry is (description, predicate, opts). The first entry has no
+    predicate; later ones are only attempted when the predicate matches the
+    error from the previous attempt.
+    """
+    yield "original options", None, base_opts
+
+    # Proxy failures are common (407, tunnel errors). Retry once without proxy.
+    if base_opts.get("proxy") != "":
+        yield "without proxy", _is_proxy_error, _ydl_opts_without_proxy(base_opts)
+
+    # INNERTUBE_CONTEXT errors are often caused by proxy returning consent/bot
+    # pages or stale cookies. The Webshare -rotate endpoint gives a fresh
+    # residential IP each connection, so retry through it without cookies.
+    if settings.webshare_proxy_enabled and settings.webshare_proxy_username:
+        yield (
+            "with Webshare proxy (no cookies)",
+            _is_innertube_context_error,
+            _ydl_opts_with_webshare(base_opts, settings),
+        )
+
+
+def _run_ydl_attempts(
+    run: Callable[[Mapping[str, Any]], T],
+    base_opts: Mapping[str, Any],
+    settings: Settings,
+    action: str,
+) -> T:
+    """
+    Call run(opts) for each applicable variant from _ydl_attempts.
+
+    Returns the first successful result, or re-raises the last yt-dlp
+    DownloadError once no remaining variant matches it.
+    """
+    import yt_dlp
+
+    last_error: yt_dlp.utils.DownloadError | None = None
+    for description, applies, opts in _ydl_attempts(base_opts, settings):
+        if last_error is not None:
+            if not applies(str(last_error)):
+                continue
+            logger.warning("[yt-dlp] error while %s; retrying %s", action, description)
+        try:
+            return run(opts)
+        except yt_dlp.utils.DownloadError as e:
+            last_error = e
+    raise last_error
+
+# POT provider probe result, refreshed at most once per _POT_CACHE_TTL seconds
+_POT_CACHE_TTL = 30.0
+_POT_PROBE_TIMEOUT = 0.05
+_POT_CACHE: dict[str, Any] = {"ts": 0.0, "available": None}
+_POT_LOCK = threading.Lock()
+
+
+def _pot_available() -> bool:
+    """
+    Check whether the POT provider is listening on port 4416.
+
+    The TCP probe is cached for _POT_CACHE_TTL seconds so metadata fetches
+    and downloads don't each pay a socket round-trip. Availability changes
+    are logged once, on transition.
+    """
+    with _POT_LOCK:
+        now = time.monotonic()
+        if _POT_CACHE["available"] is not None and now - _POT_CACHE["ts"] < _POT_CACHE_TTL:
+            return _POT_CACHE["available"]
+
+        available = False
+        try:
+            # A local listener accepts almost immediately, so a down provider
+            # costs ~50ms, not 1s. The socket timeout waits with poll(), which
+            # unlike select() has no fd < 1024 limit on busy workers.
+            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+                sock.settimeout(_POT_PROBE_TIMEOUT)
+                available = (sock.connect_ex(('127.0.0.1', 4416)) == 0)
+        except Exception:
+            pass
+
+        if available != _POT_CACHE["available"]:
+            if available:
+                logger.info("POT provider detected on port 4416")
+            else:
+                logger.warning("POT provider NOT available - using fallback player clients only")
+
+        _POT_CACHE["ts"] = now
+        _POT_CACHE["available"] = available
+        return available
+
+
+def _resolve_proxy(settings: Settings, include_tor: bool = True) -> tuple[str | None, str | None]:
+    """
+    Pick the download proxy from settings: Webshare > Residential > Tor.
+
+    Returns:
+        Tuple of (proxy_url, label for logging), or (None, None) for direct
+    """
+    if settings.webshare_proxy_enabled and settings.webshare_proxy_username:
+        return settings.webshare_http_proxy_url, "Webshare rotating residential proxy"
+    if settings.proxy_enabled and settings.proxy_url:
+        return settings.proxy_url, "residential proxy"
+    if include_tor and settings.tor_proxy_enabled:
+        return settings.tor_proxy_url, f"Tor proxy (fallback): {settings.tor_proxy_url}"
+    return None, None
+
+
+# Last get_common_ydl_opts() result, reused until settings or cookies validity
+# change or _YDL_OPTS_TTL seconds pass
+_YDL_OPTS_TTL = 60.0
+_YDL_OPTS_CACHE: dict[str, Any] = {"settings": None, "cookies_valid": None, "ts": 0.0, "opts": None}
+_YDL_OPTS_LOCK = threading.Lock()
+
 
 # Common yt-dlp options to avoid bot detection
-def get_common_ydl_opts():
+def get_common_ydl_opts(settings: Settings | None = None):
     """
     Get common yt-dlp options with enhanced anti-bot detection measures.
 
@@ -148,33 +347,39 @@ def get_common_ydl_opts():
     NOTE: Do NOT set custom http_headers (User-Agent etc). yt-dlp sets
     per-client User-Agents internally. A mismatched User-Agent + TLS
     fingerprint is a strong bot detection signal.
-    """
-    settings = get_settings()
 
-    # Check if POT provider is actually running
-    pot_available = False
-    try:
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        sock.settimeout(1)
-        result = sock.connect_ex(('127.0.0.1', 4416))
-        pot_available = (result == 0)
-        sock.close()
-    except Exception:
-        pass
+    The options are cached for _YDL_OPTS_TTL seconds; each caller gets a
+    shallow copy it may extend, but must not mutate nested values.
+    """
+    if settings is None:
+        settings = get_settings()
 
-    if pot_available:
-        logger.info("POT provider detected on port 4416")
-    else:
-        logger.warning("POT provider NOT available - using fallback player clients only")
+    # Check if POT provider is actually running (cached; logs on change only)
+    _pot_available()
 
+    cookies_valid = _cookies_valid_now()
+    with _YDL_OPTS_LOCK:
+        now = time.monotonic()
+        if (
+            _YDL_OPTS_CACHE["settings"] is settings
+            and _YDL_OPTS_CACHE["cookies_valid"] == cookies_valid
+            and now - _YDL_OPTS_CACHE["ts"] < _YDL_OPTS_TTL
+        ):
+            return dict(_YDL_OPTS_CACHE["opts"])
+
+        opts = _build_common_ydl_opts(settings, cookies_valid)
+        _YDL_OPTS_CACHE.update(settings=settings, cookies_valid=cookies_valid, ts=now, opts=opts)
+        return dict(opts)
+
+
+def _build_common_ydl_opts(settings: Settings, cookies_valid: bool) -> dict[str, Any]:
+    """Build the options returned by get_common_ydl_opts()."""
     # Note: curl_cffi was removed - the impersonate feature requires native deps
     # that don't work reliably in Docker containers
 
-    cookies_valid = _cookies_valid_now()
     opts = {
         "quiet": True,
         "no_warnings": True,
-        "cookiefile": COOKIES_FILE if cookies_valid else None,
         # Enable remote JS challenge solver (required for YouTube 2025+)
         # Downloads solver from GitHub to handle YouTube's signature challenges
         "remote_components": ["ejs:github"],
@@ -192,25 +397,24 @@ def get_common_ydl_opts():
         },
         # Do NOT set http_headers — yt-dlp sets per-client User-Agents internally.
         # A custom User-Agent with Python's TLS fingerprint triggers bot detection.
-        # Retry configuration for transient failures
-        "retries": 3,
-        "fragment_retries": 3,
+        # Bounded timeouts/retries so a stalled CDN fails fast instead of
+        # holding a worker; our own fallbacks (proxy, Webshare, pytubefix) follow
+        "socket_timeout": 15,
+        "retries": 2,
+        "fragment_retries": 2,
+        "extractor_retries": 1,
         "file_access_retries": 2,
     }
 
+    # Leave the key out entirely (rather than None) when there are no usable cookies
+    if cookies_valid:
+        opts["cookiefile"] = COOKIES_FILE
+
     # Proxy priority: Webshare > Residential > Tor > No proxy
-    if settings.webshare_proxy_enabled and settings.webshare_proxy_username:
-        opts["proxy"] = settings.webshare_http_proxy_url
-        print("[yt-dlp] Using Webshare rotating residential proxy")
-        logger.info("[yt-dlp] Using Webshare rotating residential proxy")
-    elif settings.proxy_enabled and settings.proxy_url:
-        opts["proxy"] = settings.proxy_url
-        print("[yt-dlp] Using residential proxy")
-        logger.info("[yt-dlp] Using residential proxy")
-    elif settings.tor_proxy_enabled:
-        opts["proxy"] = settings.tor_proxy_url
-        print(f"[yt-dlp] Using Tor proxy (fallback): {settings.tor_proxy_url}")
-        logger.info(f"[yt-dlp] Using Tor proxy (fallback): {settings.tor_proxy_url}")
+    proxy_url, proxy_label = _resolve_proxy(settings)
+    if proxy_url:
+        opts["proxy"] = proxy_url
+        logger.info("[yt-dlp] Using %s", proxy_label)
 
     # POT provider will be auto-detected by yt-dlp on port 4416 if running
     # bgutil-ytdlp-pot-provider registers as yt-dlp plugin
@@ -218,6 +422,113 @@ def get_common_ydl_opts():
     return opts
 
 
+# Ordered (pattern, exception) rules for classify_youtube_error; the earliest
+# rule matching anywhere in the message wins
+_ERROR_CLASSIFIERS: list[tuple[str, type[YouTubeError]]] = [
+    (r"sign in to confirm|bot", YouTubeBlockedError),
+    (r"429|rate limit|too many", YouTubeRateLimitError),
+    (r"private", VideoUnavailableError),
+    (r"age|login|cookies", YouTubeCookiesRequiredError),
+    (r"not found|404|unavailable", VideoNotFoundError),
+]
+# All rules as one scan: a zero-width lookahead reports every position where
+# some rule matches, and the named group says which (highest-priority) one
+_ERROR_CLASSIFIER_RE = re.compile(
+    "(?=" + "|".join(f"(?P<r{i}>{pattern})" for i, (pattern, _) in enumerate(_ERROR_CLASSIFIERS)) + ")",
+    re.IGNORECASE,
+)
+
+
+# Idle YoutubeDL instances for metadata extraction, keyed by options hash, as
+# (cookie file version they were created with, instances). Only one cookie
+# version is kept per key: yt-dlp rewrites cookies.txt whenever an instance
+# closes, so older versions would otherwise pile up unused. Instances are
+# checked out exclusively, so no two threads share one.
+_YDL_POOL: dict[str, tuple[tuple[int, int] | None, list["yt_dlp.YoutubeDL"]]] = {}
+_YDL_LOCK = threading.Lock()
+_YDL_POOL_MAX_IDLE = 4
+
+
+def _ydl_opts_key(opts: Mapping[str, Any]) -> str:
+    """Hash yt-dlp options into a pool key."""
+    payload = json.dumps(dict(opts), sort_keys=True, default=str)
+    return hashlib.md5(payload.encode()).hexdigest()
+
+
+def _ydl_cookies_version(opts: Mapping[str, Any]) -> tuple[int, int] | None:
+    """(mtime_ns, size) of the options' cookie file, or None if unset or missing."""
+    cookiefile = opts.get("cookiefile")
+    return _file_version(cookiefile) if cookiefile else None
+
+
+def _discard_ydls(instances: list["yt_dlp.YoutubeDL"]) -> None:
+    """
+    Close pooled YoutubeDL instances without saving their cookie jars.
+
+    YoutubeDL.close() writes its jar back to the cookie file. A pooled jar can
+    predate a hot update of cookies.txt, so saving it would undo the update.
+    """
+    for ydl in instances:
+        ydl.params["cookiefile"] = None
+        with contextlib.suppress(Exception):
+            ydl.close()
+
+
+@contextlib.contextmanager
+def _pooled_ydl(opts: Mapping[str, Any]):
+    """
+    Check out a YoutubeDL for these options, reusing an idle one if possible.
+
+    Saves re-initializing extractors, cookies and plugins on every metadata
+    call. Instances that raise are discarded rather than returned to the
+    pool, and idle instances created with an older cookie file are discarded
+    at checkout so hot-updated cookies are picked up. Pooled instances never
+    write the cookie file back (see _discard_ydls).
+    """
+    import yt_dlp
+
+    key = _ydl_opts_key(opts)
+    version = _ydl_cookies_version(opts)
+    stale: list["yt_dlp.YoutubeDL"] = []
+    with _YDL_LOCK:
+        entry = _YDL_POOL.get(key)
+        if entry is not None and entry[0] != version:
+            stale = entry[1]
+            del _YDL_POOL[key]
+            entry = None
+        ydl = entry[1].pop() if entry and entry[1] else None
+    if stale:
+        _discard_ydls(stale)
+        # Tag the replacement with the file as it is now, after the discards
+        version = _ydl_cookies_version(opts)
+    if ydl is None:
+        ydl = yt_dlp.YoutubeDL(dict(opts))
+
+    try:
+        yield ydl
+    except BaseException:
+        _discard_ydls([ydl])
+        raise
+
+    with _YDL_LOCK:
+        entry = _YDL_POOL.setdefault(key, (version, []))
+        # A different version here means the cookie file changed meanwhile
+        if entry[0] == version and len(entry[1]) < _YDL_POOL_MAX_IDLE:
+            entry[1].append(ydl)
+            ydl = None
+    if ydl is not None:
+        _discard_ydls([ydl])
+
+
+@atexit.register
+def _close_ydl_pool() -> None:
+    """Close pooled YoutubeDL instances on interpreter shutdown."""
+    with _YDL_LOCK:
+        instances = [ydl for _, idle in _YDL_POOL.values() for ydl in idle]
+        _YDL_POOL.clear()
+    _discard_ydls(instances)
+
+
 def classify_youtube_error(error_msg: str) -> type[YouTubeError]:
     """
     Classify YouTube error for better handling and user feedback.
@@ -228,35 +539,41 @@ def classify_youtube_error(error_msg: str) -> type[YouTubeError]:
     Returns:
         Appropriate exception class for the error type
     """
-    error_lower = error_msg.lower()
-
-    if "sign in to confirm" in error_lower or "bot" in error_lower:
-        return YouTubeBlockedError
-    elif "429" in error_lower or "rate limit" in error_lower or "too many" in error_lower:
-        return YouTubeRateLimitError
-    elif "private" in error_lower:
-        return VideoUnavailableError
-    elif "age" in error_lower or "login" in error_lower or "cookies" in error_lower:
-        return YouTubeCookiesRequiredError
-    elif "not found" in error_lower or "404" in error_lower or "unavailable" in error_lower:
-        return VideoNotFoundError
-    else:
+    best = len(_ERROR_CLASSIFIERS)
+    for match in _ERROR_CLASSIFIER_RE.finditer(error_msg):
+        best = min(best, int(match.lastgroup[1:]))
+        if best == 0:
+            break
+    if best == len(_ERROR_CLASSIFIERS):
         return DownloadError
-
-# YouTube URL patterns
-YOUTUBE_URL_PATTERNS = [
-    r"^(https?://)?(www\.)?youtube\.com/watch\?v=([a-zA-Z0-9_-]{11})",
-    r"^(https?://)?(www\.)?youtu\.be/([a-zA-Z0-9_-]{11})",
-    r"^(https?://)?(www\.)?youtube\.com/embed/([a-zA-Z0-9_-]{11})",
-    r"^(https?://)?(www\.)?youtube\.com/v/([a-zA-Z0-9_-]{11})",
-    r"^(https?://)?(www\.)?youtube\.com/shorts/([a-zA-Z0-9_-]{11})",
-]
+    return _ERROR_CLASSIFIERS[best][1]
+
+
+# Every accepted YouTube URL form as one alternation, compiled once at import.
+# Exactly one group participates in a match: the URL forms (watch, youtu.be,
+# embed, v, shorts) anchored at the start, or a v= query parameter anywhere.
+# Bare IDs are recognized in extract_video_id without the regex.
+_VIDEO_ID_RE = re.compile(
+    r"^(?:https?://)?(?:www\.)?"
+    r"(?:youtube\.com/(?:watch\?v=|embed/|v/|shorts/)|youtu\.be/)"
+    r"([a-zA-Z0-9_-]{11})"
+    r"|v=([a-zA-Z0-9_-]{11})"
+)
+
+# The two URL shapes nearly all requests use, checked with plain string ops
+# before falling back to _VIDEO_ID_RE
+_FAST_PATH_PREFIXES = (
+    "https://www.youtube.com/watch?v=",
+    "https://youtu.be/",
+)
+_VIDEO_ID_CHARS = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_-"
 
 # Twitter/X URL patterns
 TWITTER_URL_PATTERNS = [
-    r"^(https?://)?(www\.)?(twitter\.com|x\.com)/.+/status/(\d+)",
-    r"^https?://t\.co/.+",
+    re.compile(r"^(https?://)?(www\.)?(twitter\.com|x\.com)/.+/status/(\d+)"),
+    re.compile(r"^https?://t\.co/.+"),
 ]
+_TWITTER_STATUS_RE = re.compile(r"(?:twitter\.com|x\.com)/.+/status/(\d+)")
 
 
 def detect_platform(url: str) -> str:
@@ -264,46 +581,136 @@ def detect_platform(url: str) -> str:
     if extract_video_id(url) is not None:
         return "youtube"
     for pattern in TWITTER_URL_PATTERNS:
-        if re.match(pattern, url):
+        if pattern.match(url):
             return "twitter"
     return "unknown"
 
 
 def extract_twitter_status_id(url: str) -> str | None:
     """Extract Twitter/X status ID from URL."""
-    match = re.search(r"(?:twitter\.com|x\.com)/.+/status/(\d+)", url)
+    match = _TWITTER_STATUS_RE.search(url)
     if match:
         return match.group(1)
     return None
 
 
+@lru_cache(maxsize=8192)
 def extract_video_id(url: str) -> str | None:
-    """Extract YouTube video ID from various URL formats."""
-    # Check if it's just a video ID (11 characters)
-    if re.match(r"^[a-zA-Z0-9_-]{11}$", url):
-        return url
+    """
+    Extract YouTube video ID from various URL formats.
 
-    # Try each pattern
-    for pattern in YOUTUBE_URL_PATTERNS:
-        match = re.match(pattern, url)
-        if match:
-            return match.group(3)
+    Pure function of the URL string, so results are memoized — the same URL
+    is typically parsed several times per request (router, transcript
+    service, downloader).
+    """
+    # A bare video ID: the whole string is 11 ID characters (a fullmatch).
+    # strip() leaves nothing iff every character is a valid ID character.
+    if len(url) == 11 and not url.strip(_VIDEO_ID_CHARS):
+        return url
 
-    # Try to extract from query parameter
-    if "v=" in url:
-        match = re.search(r"v=([a-zA-Z0-9_-]{11})", url)
-        if match:
-            return match.group(1)
+    for prefix in _FAST_PATH_PREFIXES:
+        if url.startswith(prefix):
+            candidate = url[len(prefix):len(prefix) + 11]
+            if len(candidate) == 11 and not candidate.strip(_VIDEO_ID_CHARS):
+                return candidate
+            break
 
+    match = _VIDEO_ID_RE.search(url)
+    if match:
+        return match.group(match.lastindex)
     return None
 
 
 def is_valid_youtube_url(url: str) -> bool:
     """Check if URL is a valid YouTube URL."""
+    # Every _VIDEO_ID_RE alternative needs one of these literals, so input
+    # without them can only be a bare ID. Rejecting it here skips the regex
+    # and keeps junk input out of the extract_video_id() cache.
+    if "youtube.com" not in url and "youtu.be" not in url and "v=" not in url:
+        return len(url) == 11 and not url.strip(_VIDEO_ID_CHARS)
     return extract_video_id(url) is not None
 
 
-def _get_metadata_via_oembed(video_id: str) -> dict[str, Any]:
+# Shared pool running metadata fetches that concurrent callers coalesce onto
+_METADATA_POOL = concurrent.futures.ThreadPoolExecutor(max_workers=16, thread_name_prefix="yt-metadata")
+
+
+# Persistent HTTP/2 client for oEmbed: warm calls skip the TCP+TLS handshake and
+# concurrent lookups multiplex over one connection. The transport retries
+# failed connects (not HTTP errors) so a dropped pooled connection is reopened.
+_OEMBED_HTTP = httpx.Client(
+    transport=httpx.HTTPTransport(
+        http2=True,
+        retries=2,
+        limits=httpx.Limits(max_keepalive_connections=16, max_connections=32),
+    ),
+    timeout=httpx.Timeout(10.0, connect=3.0),
+    headers={"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"},
+    # Consent/region redirects must be followed, as urlopen() used to
+    follow_redirects=True,
+)
+atexit.register(_OEMBED_HTTP.close)
+
+# oEmbed statuses worth retrying, and the backoff schedule for them. Only the
+# get_video_metadata() fallback retries; the router's prefetch is one attempt
+# so a 429 can't hold up the captions fast path.
+_OEMBED_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+_OEMBED_FALLBACK_ATTEMPTS = 3
+_OEMBED_BACKOFF_BASE = 0.5
+_OEMBED_MAX_DELAY = 10.0
+
+
+def _oembed_retry_delay(response: httpx.Response, attempt: int) -> float:
+    """Seconds to wait before retrying: Retry-After if sent, else backoff with jitter."""
+    retry_after = response.headers.get("Retry-After")
+    if retry_after:
+        try:
+            seconds = float(retry_after)
+            # float() also accepts "nan"/"inf", which time.sleep() rejects
+            if math.isfinite(seconds):
+                return min(max(seconds, 0.0), _OEMBED_MAX_DELAY)
+        except ValueError:
+            pass
+        try:
+            retry_at = email.utils.parsedate_to_datetime(retry_after)
+            return min(max(retry_at.timestamp() - time.time(), 0.0), _OEMBED_MAX_DELAY)
+        except (TypeError, ValueError):
+            pass
+
+    delay = min(_OEMBED_BACKOFF_BASE * 2**attempt, _OEMBED_MAX_DELAY)
+    # Add +/- 50% jitter
+    return delay * (0.5 + random.random())
+
+
+def youtube_thumbnail_url(video_id: str, quality: str = "maxresdefault") -> str:
+    """
+    Build a YouTube thumbnail URL (quality: maxresdefault, hqdefault, ...).
+
+    Metadata dicts carry only the full-size thumbnail; other sizes (e.g. the
+    hqdefault "thumbnail_small") are derived on demand by the API layer.
+    """
+    return f"https://img.youtube.com/vi/{video_id}/{quality}.jpg"
+
+
+# oEmbed replies are ~1KB; anything past this cap is treated as a bad response
+_OEMBED_MAX_BYTES = 64 * 1024
+
+
+def _read_oembed_body(response: httpx.Response) -> bytes:
+    """Read a streamed oEmbed response body, refusing more than _OEMBED_MAX_BYTES."""
+    content_length = response.headers.get("Content-Length")
+    if content_length and content_length.isdigit() and int(content_length) > _OEMBED_MAX_BYTES:
+        raise YouTubeError(f"oEmbed response too large ({content_length} bytes)")
+
+    body = bytearray()
+    for chunk in response.iter_bytes():
+        body += chunk
+        if len(body) > _OEMBED_MAX_BYTES:
+            raise YouTubeError(f"oEmbed response exceeded {_OEMBED_MAX_BYTES} bytes")
+    return bytes(body)
+
+
+def _get_metadata_via_oembed(video_id: str, attempts: int = 1) -> dict[str, Any]:
     """
     Get video metadata via YouTube's oEmbed API (no auth required).
 
@@ -313,6 +720,8 @@ def _get_metadata_via_oembed(video_id: str) -> dict[str, Any]:
 
     Args:
         video_id: YouTube video ID
+        attempts: Total tries; 429/5xx replies are retried with backoff
+            (honoring Retry-After) until these run out
 
     Returns:
         dict with video_id, title, channel_name, thumbnail
@@ -323,46 +732,225 @@ def _get_metadata_via_oembed(video_id: str) -> dict[str, Any]:
     """
     oembed_url = f"https://www.youtube.com/oembed?url=https://www.youtube.com/watch?v={video_id}&format=json"
 
-    try:
-        req = urllib.request.Request(
-            oembed_url,
-            headers={
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-            },
+    for attempt in range(attempts):
+        try:
+            with _OEMBED_HTTP.stream("GET", oembed_url) as response:
+                body = _read_oembed_body(response) if response.status_code < 400 else b""
+        except YouTubeError:
+            raise
+        except Exception as e:
+            raise YouTubeError(f"Failed to get oEmbed metadata: {e}")
+
+        if response.status_code not in _OEMBED_RETRY_STATUSES or attempt == attempts - 1:
+            break
+
+        delay = _oembed_retry_delay(response, attempt)
+        logger.warning(
+            "oEmbed returned %s for %s; retrying in %.1fs", response.status_code, video_id, delay
         )
-        with urllib.request.urlopen(req, timeout=10) as response:
-            data = json.loads(response.read().decode("utf-8"))
-
-            return {
-                "video_id": video_id,
-                "title": data.get("title", "Unknown"),
-                "channel_name": data.get("author_name", "Unknown"),
-                "thumbnail": f"https://img.youtube.com/vi/{video_id}/maxresdefault.jpg",
-                "thumbnail_small": f"https://img.youtube.com/vi/{video_id}/hqdefault.jpg",
-                "duration": 0,  # oEmbed doesn't provide duration
-                "view_count": None,
-                "upload_date": None,
-                "description": "",
-            }
+        time.sleep(delay)
 
-    except urllib.error.HTTPError as e:
-        if e.code == 404:
-            raise VideoNotFoundError(f"Video not found: {video_id}")
-        elif e.code == 401 or e.code == 403:
-            raise VideoUnavailableError(f"Video is private or unavailable: {video_id}")
-        else:
-            raise YouTubeError(f"HTTP error {e.code}: {e.reason}")
+    if response.status_code == 404:
+        raise VideoNotFoundError(f"Video not found: {video_id}")
+    elif response.status_code == 401 or response.status_code == 403:
+        raise VideoUnavailableError(f"Video is private or unavailable: {video_id}")
+    elif response.status_code >= 400:
+        raise YouTubeError(f"HTTP error {response.status_code}: {response.reason_phrase}")
+
+    try:
+        data = orjson.loads(body)
     except Exception as e:
         raise YouTubeError(f"Failed to get oEmbed metadata: {e}")
 
+    return {
+        "video_id": video_id,
+        "title": data.get("title", "Unknown"),
+        "channel_name": data.get("author_name", "Unknown"),
+        "thumbnail": youtube_thumbnail_url(video_id),
+        "duration": 0,  # oEmbed doesn't provide duration
+        "view_count": None,
+        "upload_date": None,
+        "description": "",
+    }
+
+
+# Max description length returned in metadata
+_DESCRIPTION_MAX_CHARS = 500
+
+
+def _take_description(info: dict[str, Any]) -> str:
+    """
+    Pop the description from a yt-dlp info dict, truncated for metadata.
+
+    Removing it from info lets the full (often tens of KB) string be freed
+    right away instead of living as long as the info dict.
+    """
+    description = info.pop("description", None)
+    if not description:
+        return ""
+    return str(description)[:_DESCRIPTION_MAX_CHARS]
+
+
+def _upload_date_from_timestamp(info: dict[str, Any]) -> str | None:
+    """
+    Derive YYYYMMDD from an info dict's UTC timestamp.
+
+    yt-dlp only fills upload_date while processing a result, so the raw
+    extractor output used for metadata (process=False) carries the timestamp
+    alone.
+    """
+    timestamp = info.get("timestamp")
+    if timestamp is None:
+        return None
+    try:
+        return time.strftime("%Y%m%d", time.gmtime(timestamp))
+    except (OverflowError, OSError, ValueError):
+        return None
+
+
+@dataclass(frozen=True, slots=True)
+class YouTubeMetadata:
+    """YouTube metadata extracted by yt-dlp, as kept in the metadata caches."""
+
+    video_id: str
+    title: str
+    channel_name: str
+    thumbnail: str
+    duration: int
+    view_count: int | None
+    upload_date: str | None
+    description: str
+
+    def to_dict(self) -> dict[str, Any]:
+        """The get_video_metadata() dict for this video (a fresh copy)."""
+        return asdict(self)
+
+
+def _build_youtube_metadata(video_id: str, info: dict[str, Any]) -> YouTubeMetadata:
+    """Build YouTubeMetadata from a yt-dlp info dict."""
+    return YouTubeMetadata(
+        video_id=video_id,
+        title=info.get("title", "Unknown"),
+        channel_name=info.get("uploader", info.get("channel", "Unknown")),
+        thumbnail=youtube_thumbnail_url(video_id),
+        duration=info.get("duration", 0),
+        view_count=info.get("view_count"),
+        upload_date=info.get("upload_date") or _upload_date_from_timestamp(info),
+        description=_take_description(info),
+    )
+
+
+# Recent yt-dlp metadata by video ID as (stored_at, metadata), least recently
+# used evicted first and entries expiring after _METADATA_TTL seconds.
+# oEmbed fallbacks aren't cached, so a transient block doesn't pin duration 0.
+_METADATA_CACHE_MAX = 1024
+_METADATA_TTL = 3600.0
+_METADATA_CACHE: OrderedDict[str, tuple[float, YouTubeMetadata]] = OrderedDict()
+_METADATA_CACHE_LOCK = threading.Lock()
+
+
+def _metadata_cache_get(video_id: str) -> dict[str, Any] | None:
+    """Return a copy of the cached metadata for video_id, if present and fresh."""
+    with _METADATA_CACHE_LOCK:
+        entry = _METADATA_CACHE.get(video_id)
+        if entry is None:
+            return None
+        stored_at, metadata = entry
+        if time.monotonic() - stored_at >= _METADATA_TTL:
+            del _METADATA_CACHE[video_id]
+            return None
+        _METADATA_CACHE.move_to_end(video_id)
+    return metadata.to_dict()
+
+
+def _metadata_cache_put(video_id: str, metadata: YouTubeMetadata) -> None:
+    """Cache metadata for video_id, evicting the oldest entry if full."""
+    with _METADATA_CACHE_LOCK:
+        _METADATA_CACHE[video_id] = (time.monotonic(), metadata)
+        _METADATA_CACHE.move_to_end(video_id)
+        if len(_METADATA_CACHE) > _METADATA_CACHE_MAX:
+            _METADATA_CACHE.popitem(last=False)
+
+
+# On-disk metadata entries older than this are ignored (file mtime based)
+_METADATA_DISK_TTL = 86400.0
+
+
+def _metadata_disk_path(video_id: str) -> str | None:
+    """Path of the on-disk cache entry for video_id, or None if disabled."""
+    cache_dir = get_settings().metadata_cache_dir
+    if not cache_dir:
+        return None
+    return os.path.join(cache_dir, f"{video_id}.json")
 
-def get_video_metadata(video_url: str) -> dict[str, Any]:
+
+def _metadata_disk_get(video_id: str) -> YouTubeMetadata | None:
+    """Read fresh metadata for video_id from the disk cache, if enabled."""
+    path = _metadata_disk_path(video_id)
+    if path is None:
+        return None
+    try:
+        if time.time() - os.stat(path).st_mtime >= _METADATA_DISK_TTL:
+            return None
+        with open(path, "rb") as f:
+            return YouTubeMetadata(**orjson.loads(f.read()))
+    # TypeError: an entry whose fields don't match YouTubeMetadata
+    except (OSError, orjson.JSONDecodeError, TypeError):
+        return None
+
+
+def _metadata_disk_put(video_id: str, metadata: YouTubeMetadata) -> None:
+    """Write metadata for video_id to the disk cache, if enabled. Best effort."""
+    path = _metadata_disk_path(video_id)
+    if path is None:
+        return
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Write then rename so concurrent readers never see a partial file
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(orjson.dumps(metadata))
+        os.replace(tmp_path, path)
+    except (OSError, TypeError) as e:
+        logger.warning("Failed to write metadata cache for %s: %s", video_id, e)
+
+
+# Metadata fetches in progress: video ID -> future of the fetch
+_METADATA_INFLIGHT: dict[str, concurrent.futures.Future] = {}
+_METADATA_INFLIGHT_LOCK = threading.Lock()
+
+
+def _metadata_inflight_done(video_id: str, future: concurrent.futures.Future) -> None:
+    """Forget a finished fetch so the next caller hits the cache or starts a new one."""
+    with _METADATA_INFLIGHT_LOCK:
+        if _METADATA_INFLIGHT.get(video_id) is future:
+            del _METADATA_INFLIGHT[video_id]
+
+
+def get_video_metadata(
+    video_url: str,
+    prefer_fast: bool = False,
+    ytdlp_deadline: float | None = None,
+) -> dict[str, Any]:
     """
     Extract video metadata without downloading.
 
     Uses yt-dlp first (more complete data), falls back to oEmbed API
     if yt-dlp fails due to cookie/bot detection issues.
 
+    Args:
+        video_url: YouTube video URL or ID
+        prefer_fast: Skip yt-dlp entirely and return oEmbed metadata
+            (duration 0). For callers that only need title/channel/thumbnail.
+        ytdlp_deadline: If set, wait at most this many seconds for yt-dlp,
+            then answer from oEmbed (duration 0) while yt-dlp finishes in the
+            background and fills the cache. oEmbed is only requested once the
+            deadline passes, so fast yt-dlp answers cost no extra request.
+
+    Successful yt-dlp results are kept in an in-process LRU/TTL cache (and
+    on disk when METADATA_CACHE_DIR is set), which also serves prefer_fast
+    callers, and concurrent calls for the same video share a single fetch.
+
     Returns:
         dict with video_id, title, channel_name, thumbnail, duration, etc.
     """
@@ -370,114 +958,287 @@ def get_video_metadata(video_url: str) -> dict[str, Any]:
     if not video_id:
         raise VideoNotFoundError("Invalid YouTube URL format")
 
+    cached = _metadata_cache_get(video_id)
+    if cached is not None:
+        return cached
+
+    cached = _metadata_disk_get(video_id)
+    if cached is not None:
+        _metadata_cache_put(video_id, cached)
+        return cached.to_dict()
+
+    if prefer_fast:
+        try:
+            return _get_metadata_via_oembed(video_id)
+        except (VideoNotFoundError, VideoUnavailableError):
+            raise
+        except Exception as e:
+            raise YouTubeError(f"Failed to get oEmbed metadata: {e}")
+
     # Normalize URL
     normalized_url = f"https://www.youtube.com/watch?v={video_id}"
 
+    settings = get_settings()
+    common_opts = get_common_ydl_opts(settings)
     ydl_opts = {
-        **get_common_ydl_opts(),
+        **common_opts,
         "extract_flat": False,
         "skip_download": True,
+        # Nothing is downloaded, so skip fetching the DASH/HLS format manifests.
+        # player_client is left as-is (see get_common_ydl_opts for why).
+        "extractor_args": {
+            "youtube": {**common_opts["extractor_args"]["youtube"], "skip": ["dash", "hls"]},
+        },
     }
 
-    def _build_metadata(info: dict[str, Any]) -> dict[str, Any]:
-        return {
-            "video_id": video_id,
-            "title": info.get("title", "Unknown"),
-            "channel_name": info.get("uploader", info.get("channel", "Unknown")),
-            "thumbnail": f"https://img.youtube.com/vi/{video_id}/maxresdefault.jpg",
-            "thumbnail_small": f"https://img.youtube.com/vi/{video_id}/hqdefault.jpg",
-            "duration": info.get("duration", 0),
-            "view_count": info.get("view_count"),
-            "upload_date": info.get("upload_date"),
-            "description": (info.get("description") or "")[:500],
-        }
-
-    def _extract_with_opts(opts: dict[str, Any]) -> dict[str, Any] | None:
-        with yt_dlp.YoutubeDL(opts) as ydl:
-            return ydl.extract_info(normalized_url, download=False)
-
-    # Try yt-dlp first (gives us duration and more metadata)
-    try:
-        info = _extract_with_opts(ydl_opts)
-
+    def _extract_with_opts(opts: Mapping[str, Any]) -> dict[str, Any] | None:
+        with _pooled_ydl(opts) as ydl:
+            # process=False returns the extractor's raw result and skips
+            # format selection, which metadata never needs. Only resolve
+            # further when the extractor hands back a redirect instead of
+            # the video itself.
+            info = ydl.extract_info(normalized_url, download=False, process=False)
+            if info is not None and info.get("_type", "video") != "video":
+                info = ydl.process_ie_result(info, download=False)
+            return info
+
+    def _fetch_metadata_with_opts(opts: Mapping[str, Any]) -> YouTubeMetadata:
+        info = _extract_with_opts(opts)
         if info is None:
             raise VideoNotFoundError(f"Video not found: {video_id}")
+        return _build_youtube_metadata(video_id, info)
 
-        logger.info(f"Got metadata via yt-dlp for {video_id}")
-        return _build_metadata(info)
-
-    except yt_dlp.utils.DownloadError as e:
-        error_msg = str(e).lower()
+    def _fetch_metadata() -> dict[str, Any]:
+        # Imported here so cache hits and prefer_fast never load yt-dlp
+        import yt_dlp
 
-        # Proxy failures are common (407, tunnel errors). Retry once without proxy.
-        if _is_proxy_error(error_msg) and ydl_opts.get("proxy") != "":
-            logger.warning("yt-dlp proxy error while fetching metadata; retrying without proxy")
-            try:
-                info = _extract_with_opts(_ydl_opts_without_proxy(ydl_opts))
-                if info is None:
-                    raise VideoNotFoundError(f"Video not found: {video_id}")
-                logger.info(f"Got metadata via yt-dlp without proxy for {video_id}")
-                return _build_metadata(info)
-            except yt_dlp.utils.DownloadError as retry_err:
-                e = retry_err
-                error_msg = str(e).lower()
-
-        # INNERTUBE_CONTEXT errors are often caused by proxy returning consent/bot
-        # pages or stale cookies.
-        if _is_innertube_context_error(error_msg):
-            settings = get_settings()
+        # Try yt-dlp first (gives us duration and more metadata)
+        try:
+            metadata = _run_ydl_attempts(
+                _fetch_metadata_with_opts, ydl_opts, settings, "fetching metadata"
+            )
+            logger.info("Got metadata via yt-dlp for %s", video_id)
+            _metadata_cache_put(video_id, metadata)
+            _metadata_disk_put(video_id, metadata)
+            return metadata.to_dict()
+
+        except yt_dlp.utils.DownloadError as e:
+            error_msg = str(e)
+
+            # Check for definitive errors that won't be fixed by oEmbed
+            if _PRIVATE_ERROR_RE.search(error_msg):
+                raise VideoUnavailableError(f"Video is private: {video_id}")
+
+            # oEmbed would be rate limited too, and can't find a missing video.
+            # The classifier's VideoUnavailableError ("private") is handled above.
+            error_class = classify_youtube_error(error_msg)
+            if error_class is YouTubeRateLimitError:
+                raise YouTubeRateLimitError(
+                    f"Rate limited by YouTube for video {video_id}. "
+                    "Try again later or use a different IP."
+                )
+            elif error_class is VideoNotFoundError:
+                raise VideoNotFoundError(f"Video not found: {video_id}")
 
-            # If Webshare is active, retry WITH Webshare but without cookies.
-            # The -rotate endpoint gives a fresh residential IP each connection.
-            if settings.webshare_proxy_enabled and settings.webshare_proxy_username:
-                logger.warning("[yt-dlp] INNERTUBE error; retrying metadata with Webshare proxy (no cookies)")
+            # For bot detection / cookie issues, try oEmbed fallback
+            if _BOT_CHECK_ERROR_RE.search(error_msg):
+                logger.warning("yt-dlp blocked by bot detection, trying oEmbed for %s", video_id)
                 try:
-                    webshare_opts = dict(ydl_opts)
-                    webshare_opts["proxy"] = settings.webshare_http_proxy_url
-                    webshare_opts["cookiefile"] = None
-                    info = _extract_with_opts(webshare_opts)
-                    if info is None:
-                        raise VideoNotFoundError(f"Video not found: {video_id}")
-                    logger.info(f"Got metadata via yt-dlp with Webshare (no cookies) for {video_id}")
-                    return _build_metadata(info)
-                except yt_dlp.utils.DownloadError as retry_err:
-                    e = retry_err
-                    error_msg = str(e).lower()
-
-        # Check for definitive errors that won't be fixed by oEmbed
-        if "private" in error_msg:
-            raise VideoUnavailableError(f"Video is private: {video_id}")
-
-        # For bot detection / cookie issues, try oEmbed fallback
-        if "sign in" in error_msg or "bot" in error_msg or "cookies" in error_msg:
-            logger.warning(f"yt-dlp blocked by bot detection, trying oEmbed for {video_id}")
+                    return _get_metadata_via_oembed(video_id, _OEMBED_FALLBACK_ATTEMPTS)
+                except (VideoNotFoundError, VideoUnavailableError):
+                    raise
+                except Exception as oembed_error:
+                    logger.warning("oEmbed also failed: %s", oembed_error)
+                    # Re-raise original yt-dlp error
+                    raise VideoNotFoundError(f"Failed to get video info: {e}")
+
+            # For other errors, try oEmbed as fallback
+            logger.warning("yt-dlp failed (%s), trying oEmbed for %s", e, video_id)
             try:
-                return _get_metadata_via_oembed(video_id)
+                return _get_metadata_via_oembed(video_id, _OEMBED_FALLBACK_ATTEMPTS)
             except (VideoNotFoundError, VideoUnavailableError):
                 raise
-            except Exception as oembed_error:
-                logger.warning(f"oEmbed also failed: {oembed_error}")
-                # Re-raise original yt-dlp error
+            except Exception:
                 raise VideoNotFoundError(f"Failed to get video info: {e}")
 
-        # For other errors, try oEmbed as fallback
-        logger.warning(f"yt-dlp failed ({e}), trying oEmbed for {video_id}")
-        try:
-            return _get_metadata_via_oembed(video_id)
-        except (VideoNotFoundError, VideoUnavailableError):
-            raise
-        except Exception:
-            raise VideoNotFoundError(f"Failed to get video info: {e}")
+        except Exception as e:
+            # For any other error, try oEmbed
+            logger.warning("yt-dlp error (%s), trying oEmbed for %s", e, video_id)
+            try:
+                return _get_metadata_via_oembed(video_id, _OEMBED_FALLBACK_ATTEMPTS)
+            except (VideoNotFoundError, VideoUnavailableError):
+                raise
+            except Exception:
+                raise YouTubeError(f"Unexpected error: {e}")
+
+    # Concurrent callers for the same video share one fetch
+    with _METADATA_INFLIGHT_LOCK:
+        future = _METADATA_INFLIGHT.get(video_id)
+        started = future is None
+        if started:
+            future = _METADATA_POOL.submit(_fetch_metadata)
+            _METADATA_INFLIGHT[video_id] = future
+    if started:
+        future.add_done_callback(lambda f: _metadata_inflight_done(video_id, f))
+
+    # Results are shared between coalesced callers, so each gets its own copy
+    try:
+        return dict(future.result(timeout=ytdlp_deadline))
+    except concurrent.futures.TimeoutError:
+        pass
 
+    try:
+        metadata = _get_metadata_via_oembed(video_id)
+    except (VideoNotFoundError, VideoUnavailableError):
+        raise
     except Exception as e:
-        # For any other error, try oEmbed
-        logger.warning(f"yt-dlp error ({e}), trying oEmbed for {video_id}")
-        try:
-            return _get_metadata_via_oembed(video_id)
-        except (VideoNotFoundError, VideoUnavailableError):
-            raise
-        except Exception:
-            raise YouTubeError(f"Unexpected error: {e}")
+        logger.warning("oEmbed failed (%s), waiting for yt-dlp for %s", e, video_id)
+        return dict(future.result())
+    logger.info("yt-dlp exceeded %ss, using oEmbed metadata for %s", ytdlp_deadline, video_id)
+    return metadata
+
+
+def get_video_metadata_batch(
+    video_urls: list[str],
+    max_workers: int = 8,
+    return_exceptions: bool = False,
+) -> list[Any]:
+    """
+    Fetch metadata for several videos concurrently.
+
+    Cached videos are answered directly; the rest run get_video_metadata()
+    on a thread pool of max_workers, since each lookup is network-bound.
+
+    Args:
+        video_urls: YouTube video URLs or IDs
+        max_workers: Maximum concurrent yt-dlp lookups
+        return_exceptions: If True, a failed lookup's exception is placed in
+            the result list instead of being raised
+
+    Returns:
+        Metadata dicts (or exceptions) in the same order as video_urls
+    """
+    results: list[Any] = [None] * len(video_urls)
+    pending: list[int] = []
+    for i, url in enumerate(video_urls):
+        video_id = extract_video_id(url)
+        cached = _metadata_cache_get(video_id) if video_id else None
+        if cached is not None:
+            results[i] = cached
+        else:
+            pending.append(i)
+
+    if not pending:
+        return results
+
+    # A separate pool: get_video_metadata() itself waits on _METADATA_POOL tasks
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=min(max_workers, len(pending)), thread_name_prefix="yt-metadata-batch"
+    ) as pool:
+        futures = {i: pool.submit(get_video_metadata, video_urls[i]) for i in pending}
+        for i, future in futures.items():
+            try:
+                results[i] = future.result()
+            except Exception as e:
+                if not return_exceptions:
+                    raise
+                results[i] = e
+    return results
+
+
+# /dev/shm is only used for audio when it has this much free space; Docker's
+# default 64MB shm would otherwise fill up with a couple of downloads
+_AUDIO_TMPFS_MIN_FREE = 1024 * 1024 * 1024
+
+
+@lru_cache(maxsize=1)
+def _audio_tmp_root() -> str:
+    """Resolve the parent directory for per-request audio dirs (once per process)."""
+    configured = get_settings().audio_tmp_root
+    if configured:
+        return configured
+    try:
+        st = os.statvfs("/dev/shm")
+        if st.f_bavail * st.f_frsize >= _AUDIO_TMPFS_MIN_FREE:
+            return "/dev/shm"
+    except OSError:
+        pass
+    return tempfile.gettempdir()
+
+
+# Per-process parent of all audio dirs: {"pid": owner pid, "path": dir}
+_AUDIO_STAGING: dict[str, Any] = {"pid": None, "path": None}
+_AUDIO_STAGING_LOCK = threading.Lock()
+
+
+def _audio_staging_dir() -> str:
+    """
+    Return this process's audio staging directory, creating it on first use.
+
+    It is removed at exit, so audio dirs a caller forgot to clean up don't
+    outlive the worker. Keyed on pid so forked workers never share one.
+    """
+    with _AUDIO_STAGING_LOCK:
+        pid = os.getpid()
+        if _AUDIO_STAGING["pid"] != pid or not os.path.isdir(_AUDIO_STAGING["path"]):
+            path = tempfile.mkdtemp(prefix=f"ytaudio-{pid}-", dir=_audio_tmp_root())
+            atexit.register(_remove_audio_staging_dir, pid, path)
+            _AUDIO_STAGING["pid"] = pid
+            _AUDIO_STAGING["path"] = path
+        return _AUDIO_STAGING["path"]
+
+
+def _remove_audio_staging_dir(pid: int, path: str) -> None:
+    """atexit hook: remove the staging dir, but only from the process that created it."""
+    if os.getpid() == pid:
+        shutil.rmtree(path, ignore_errors=True)
+
+
+def make_audio_dir() -> str:
+    """Create a fresh directory for a downloaded audio file; remove it with cleanup_audio_dir()."""
+    return tempfile.mkdtemp(prefix="audio-", dir=_audio_staging_dir())
+
+
+def cleanup_audio_dir(path: str | None) -> None:
+    """Remove a directory created by make_audio_dir(), ignoring errors."""
+    if path:
+        shutil.rmtree(path, ignore_errors=True)
+
+
+# Extensions to look for when yt-dlp doesn't report the downloaded file path
+_AUDIO_EXTENSIONS = ("m4a", "webm", "opus", "mp4", "mp3", "ogg", "wav")
+
+
+def _downloaded_filepath(info: dict[str, Any]) -> str | None:
+    """Return the file yt-dlp wrote for this download, if it reported one."""
+    requested = info.get("requested_downloads") or [{}]
+    path = requested[0].get("filepath") or info.get("_filename")
+    if path and os.path.isfile(path):
+        return path
+    return None
+
+
+def _find_audio_file(output_dir: str, stems: tuple[str, ...]) -> str | None:
+    """
+    Find a downloaded "<stem>.<audio ext>" file in output_dir.
+
+    Uses one scandir pass instead of a stat per candidate; earlier stems and
+    earlier _AUDIO_EXTENSIONS entries win when several files match.
+    """
+    best: tuple[int, int] | None = None
+    best_path = None
+    try:
+        with os.scandir(output_dir) as it:
+            for entry in it:
+                stem, _, ext = entry.name.rpartition(".")
+                if stem not in stems or ext not in _AUDIO_EXTENSIONS or not entry.is_file():
+                    continue
+                rank = (stems.index(stem), _AUDIO_EXTENSIONS.index(ext))
+                if best is None or rank < best:
+                    best, best_path = rank, entry.path
+    except OSError:
+        return None
+    return best_path
 
 
 def download_audio(video_url: str, output_dir: str | None = None) -> tuple[str, dict[str, Any]]:
@@ -492,8 +1253,11 @@ def download_audio(video_url: str, output_dir: str | None = None) -> tuple[str,
         output_dir: Directory to save the audio file (uses temp dir if None)
 
     Returns:
-        Tuple of (audio_file_path, metadata_dict)
+        Tuple of (audio_file_path, metadata_dict). metadata_dict has the same
+        fields as get_video_metadata(), so callers don't need a second lookup.
     """
+    import yt_dlp
+
     video_id = extract_video_id(video_url)
     if not video_id:
         raise VideoNotFoundError("Invalid YouTube URL format")
@@ -503,81 +1267,61 @@ def download_audio(video_url: str, output_dir: str | None = None) -> tuple[str,
 
     # Use provided dir or create temp directory
     if output_dir is None:
-        output_dir = tempfile.mkdtemp()
+        output_dir = make_audio_dir()
 
     output_template = os.path.join(output_dir, "%(id)s.%(ext)s")
 
+    # Filename of the finished download, reported by yt-dlp's progress hook
+    captured: dict[str, str] = {}
+
+    def _capture_finished(d: dict[str, Any]) -> None:
+        if d.get("status") == "finished" and d.get("filename"):
+            captured["path"] = d["filename"]
+
     # yt-dlp options with anti-bot detection measures
+    settings = get_settings()
     ydl_opts = {
-        **get_common_ydl_opts(),
+        **get_common_ydl_opts(settings),
         # Use lowest quality audio - speech transcription doesn't need high bitrate
         # This cuts bandwidth from ~150MB to ~15-30MB per video (5-10x reduction)
         "format": "worstaudio[ext=m4a]/worstaudio",
         "outtmpl": output_template,
         # No postprocessors - skip FFmpeg re-encoding (saves 5-30s)
         # AssemblyAI accepts webm, opus, m4a, mp4, mp3 natively
+        "progress_hooks": [_capture_finished],
     }
 
-    def _download_with_opts(opts: dict[str, Any]) -> tuple[str, dict[str, Any]]:
+    def _download_with_opts(opts: Mapping[str, Any]) -> tuple[str, dict[str, Any]]:
+        captured.clear()
         with yt_dlp.YoutubeDL(opts) as ydl:
             info = ydl.extract_info(normalized_url, download=True)
 
             if info is None:
                 raise VideoNotFoundError(f"Video not found: {video_id}")
 
-            # Find the downloaded file (extension depends on what YouTube provides)
-            audio_path = None
-            for ext in ["m4a", "webm", "opus", "mp4", "mp3", "ogg", "wav"]:
-                potential_path = os.path.join(output_dir, f"{video_id}.{ext}")
-                if os.path.exists(potential_path):
-                    audio_path = potential_path
-                    break
+            # The progress hook (or the info dict) gives the final path directly
+            audio_path = (
+                captured.get("path")
+                or _downloaded_filepath(info)
+                or _find_audio_file(output_dir, (video_id,))
+            )
 
             if audio_path is None:
                 raise DownloadError(f"Failed to download audio for video: {video_id}")
 
-            metadata = {
-                "video_id": video_id,
-                "title": info.get("title", "Unknown"),
-                "channel_name": info.get("uploader", info.get("channel", "Unknown")),
-                "thumbnail": f"https://img.youtube.com/vi/{video_id}/maxresdefault.jpg",
-                "duration": info.get("duration", 0),
-            }
+            # The download extracted full metadata anyway; cache it so a later
+            # get_video_metadata() for this video skips its own extraction
+            metadata = _build_youtube_metadata(video_id, info)
+            _metadata_cache_put(video_id, metadata)
+            _metadata_disk_put(video_id, metadata)
 
-            return audio_path, metadata
+            return audio_path, metadata.to_dict()
 
     try:
-        return _download_with_opts(ydl_opts)
+        return _run_ydl_attempts(_download_with_opts, ydl_opts, settings, "downloading audio")
 
     except yt_dlp.utils.DownloadError as e:
         error_msg = str(e)
-
-        # Proxy failures are common (407, tunnel errors). Retry once without proxy.
-        if _is_proxy_error(error_msg) and ydl_opts.get("proxy") != "":
-            logger.warning("yt-dlp proxy error while downloading audio; retrying without proxy")
-            try:
-                return _download_with_opts(_ydl_opts_without_proxy(ydl_opts))
-            except yt_dlp.utils.DownloadError as retry_err:
-                e = retry_err
-                error_msg = str(e)
-        # INNERTUBE_CONTEXT errors are often caused by proxy returning consent/bot
-        # pages or stale cookies.
-        if _is_innertube_context_error(error_msg):
-            settings = get_settings()
-
-            # If Webshare is active, retry WITH Webshare but without cookies.
-            # The -rotate endpoint gives a fresh residential IP each connection.
-            if settings.webshare_proxy_enabled and settings.webshare_proxy_username:
-                logger.warning("[yt-dlp] INNERTUBE error; retrying with Webshare proxy (no cookies)")
-                try:
-                    webshare_opts = dict(ydl_opts)
-                    webshare_opts["proxy"] = settings.webshare_http_proxy_url
-                    webshare_opts["cookiefile"] = None
-                    return _download_with_opts(webshare_opts)
-                except yt_dlp.utils.DownloadError as retry_err:
-                    e = retry_err
-                    error_msg = str(e)
-
         error_class = classify_youtube_error(error_msg)
 
         if error_class == YouTubeBlockedError:
@@ -605,6 +1349,29 @@ def download_audio(video_url: str, output_dir: str | None = None) -> tuple[str,
         raise YouTubeError(f"Unexpected error during download: {e}")
 
 
+# Seconds to give a pytubefix client before starting the next one in parallel
+_PYTUBEFIX_HEDGE_DELAY = 1.5
+
+# Leading digits of a pytubefix stream's abr string (e.g. "48kbps")
+_ABR_KBPS_RE = re.compile(r"(\d+)")
+
+
+def _choose_pytubefix_clients(pot_available: bool) -> list[str]:
+    """
+    Order pytubefix clients by expected success rate.
+
+    ANDROID: Mobile client, often less restricted
+    WEB: Uses BotGuard for Proof of Origin token (requires Node.js); most
+        reliable when a POT provider is up, otherwise the slowest to fail
+    IOS: Rarely succeeds when the others fail
+
+    pytubefix doesn't use cookies.txt, so only POT availability matters.
+    """
+    if pot_available:
+        return ['WEB', 'ANDROID', 'IOS']
+    return ['ANDROID', 'IOS', 'WEB']
+
+
 def download_audio_pytubefix(video_url: str, output_dir: str | None = None) -> tuple[str, dict[str, Any]]:
     """
     Download YouTube audio using pytubefix (fallback when yt-dlp fails).
@@ -615,7 +1382,8 @@ def download_audio_pytubefix(video_url: str, output_dir: str | None = None) -> t
 
     Note: pytubefix does NOT support SOCKS5 proxies natively. We run it
     without proxy - it uses different client fingerprints (ANDROID, IOS, WEB)
-    which may bypass bot detection without needing a proxy.
+    which may bypass bot detection without needing a proxy. Clients are
+    hedged: a slow failing client doesn't hold up the next one.
 
     Args:
         video_url: YouTube video URL or ID
@@ -640,52 +1408,52 @@ def download_audio_pytubefix(video_url: str, output_dir: str | None = None) -> t
 
     # Use provided dir or create temp directory
     if output_dir is None:
-        output_dir = tempfile.mkdtemp()
+        output_dir = make_audio_dir()
 
     # Configure proxy for pytubefix
     # Priority: Webshare > Residential > None
-    settings = get_settings()
     proxies = None
-    if settings.webshare_proxy_enabled and settings.webshare_proxy_username:
-        webshare_url = settings.webshare_http_proxy_url
-        proxies = {"http": webshare_url, "https": webshare_url}
-        logger.info("[pytubefix] Using Webshare rotating residential proxy")
-        print("[pytubefix] Using Webshare rotating residential proxy")
-    elif settings.proxy_enabled and settings.proxy_url:
-        proxies = {"http": settings.proxy_url, "https": settings.proxy_url}
-        logger.info("[pytubefix] Using residential proxy")
-        print("[pytubefix] Using residential proxy")
+    proxy_url, proxy_label = _resolve_proxy(get_settings(), include_tor=False)
+    if proxy_url:
+        proxies = {"http": proxy_url, "https": proxy_url}
+        logger.info("[pytubefix] Using %s", proxy_label)
     no_proxy = {"http": None, "https": None}
 
-    # Try client types with highest success rates
-    # ANDROID: Mobile client, highest success rate, often less restricted
-    # WEB: Uses BotGuard for Proof of Origin token (requires Node.js)
-    # IOS and default rarely succeed when the first two fail
-    clients_to_try = ['ANDROID', 'WEB', 'IOS']
+    clients_to_try = _choose_pytubefix_clients(_pot_available())
 
     last_error = None
 
     def _abr_kbps(stream) -> int:
         abr = stream.abr or ""
-        match = re.match(r"(\d+)", abr)
+        match = _ABR_KBPS_RE.match(abr)
         return int(match.group(1)) if match else 10**9
 
     def _attempt_with_proxy(
         proxy_label: str, proxy_config: dict[str, str] | None
     ) -> tuple[tuple[str, dict[str, Any]] | None, bool]:
         """
-        Try all clients with a given proxy config.
+        Try all clients with a given proxy config, hedged.
+
+        The first client starts immediately and each next one starts after
+        _PYTUBEFIX_HEDGE_DELAY seconds (or as soon as everything in flight
+        has failed). The first successful download wins; files written by
+        the other attempts are removed.
+
         Returns (result, proxy_error_seen).
         """
-        nonlocal last_error
         proxy_error_seen = False
 
-        for client in clients_to_try:
+        # Downloads finished by any attempt; guarded so late finishers clean up
+        files_lock = threading.Lock()
+        downloaded: list[str] = []
+        abandoned = False
+
+        def _try_client(client: str) -> tuple[str, dict[str, Any]] | None:
+            nonlocal last_error, proxy_error_seen
             client_name = client or "default"
             logger.info(
-                f"[pytubefix] Trying {client_name} client ({proxy_label}) for video: {video_id}"
+                "[pytubefix] Trying %s client (%s) for video: %s", client_name, proxy_label, video_id
             )
-            print(f"[pytubefix] Trying {client_name} client ({proxy_label}) for video: {video_id}")
 
             try:
                 # Create YouTube object with specific client and optional proxy
@@ -702,14 +1470,14 @@ def download_audio_pytubefix(video_url: str, output_dir: str | None = None) -> t
                 # Get lowest-bitrate audio-only stream (reduces bandwidth)
                 streams = list(yt.streams.filter(only_audio=True))
                 if not streams:
-                    logger.warning(f"[pytubefix] No audio stream with {client_name} client")
-                    continue
+                    logger.warning("[pytubefix] No audio stream with %s client", client_name)
+                    return None
 
                 audio_stream = min(streams, key=_abr_kbps)
 
-                # Download the audio
+                # Download the audio (per-client filename: attempts may overlap)
                 output_ext = audio_stream.subtype or "m4a"
-                output_filename = f"{video_id}.{output_ext}"
+                output_filename = f"{video_id}.{client_name.lower()}.{output_ext}"
                 audio_path = audio_stream.download(
                     output_path=output_dir,
                     filename=output_filename,
@@ -718,54 +1486,93 @@ def download_audio_pytubefix(video_url: str, output_dir: str | None = None) -> t
                 # Verify file exists
                 if not os.path.exists(audio_path):
                     logger.warning(
-                        f"[pytubefix] Download completed but file not found with {client_name}"
+                        "[pytubefix] Download completed but file not found with %s", client_name
                     )
-                    continue
+                    return None
+
+                with files_lock:
+                    if abandoned:
+                        # Another client already won
+                        with contextlib.suppress(OSError):
+                            os.remove(audio_path)
+                        return None
+                    downloaded.append(audio_path)
 
                 metadata = {
                     "video_id": video_id,
                     "title": yt.title or "Unknown",
                     "channel_name": yt.author or "Unknown",
-                    "thumbnail": yt.thumbnail_url
-                    or f"https://img.youtube.com/vi/{video_id}/maxresdefault.jpg",
+                    "thumbnail": yt.thumbnail_url or youtube_thumbnail_url(video_id),
                     "duration": yt.length or 0,
                 }
 
                 logger.info(
-                    f"[pytubefix] Successfully downloaded with {client_name} client: {audio_path}"
+                    "[pytubefix] Successfully downloaded with %s client: %s", client_name, audio_path
                 )
-                return (audio_path, metadata), proxy_error_seen
+                return audio_path, metadata
 
             except PTVideoUnavailable as e:
-                logger.warning(f"[pytubefix] Video unavailable with {client_name}: {e}")
+                logger.warning("[pytubefix] Video unavailable with %s: %s", client_name, e)
                 last_error = e
-                continue
+                return None
             except AgeRestrictedError as e:
                 # Age restriction is the same across all clients
-                logger.warning(f"[pytubefix] Age restricted video: {e}")
+                logger.warning("[pytubefix] Age restricted video: %s", e)
                 raise YouTubeCookiesRequiredError(
                     f"Age-restricted video requires authentication: {video_id}"
                 )
             except RegexMatchError as e:
-                logger.warning(f"[pytubefix] Regex match error with {client_name}: {e}")
+                logger.warning("[pytubefix] Regex match error with %s: %s", client_name, e)
                 last_error = e
-                continue
+                return None
             except Exception as e:
-                error_msg = str(e).lower()
-                logger.warning(f"[pytubefix] Error with {client_name} client: {e}")
+                error_msg = str(e)
+                logger.warning("[pytubefix] Error with %s client: %s", client_name, e)
                 last_error = e
 
                 if _is_proxy_error(error_msg):
                     proxy_error_seen = True
 
                 # Some errors are definitive - don't try other clients
-                if "private" in error_msg:
+                if _PRIVATE_ERROR_RE.search(error_msg):
                     raise VideoUnavailableError(f"Video is private: {video_id}")
 
-                # Continue to try other clients
-                continue
+                # Let the other clients continue
+                return None
 
-        return None, proxy_error_seen
+        result = None
+        executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=len(clients_to_try), thread_name_prefix="pytubefix"
+        )
+        try:
+            pending: set[concurrent.futures.Future] = set()
+            for i, client in enumerate(clients_to_try):
+                pending.add(executor.submit(_try_client, client))
+                is_last = i == len(clients_to_try) - 1
+                hedge_at = time.monotonic() + _PYTUBEFIX_HEDGE_DELAY
+
+                # Wait for a winner; hedge with the next client after the delay
+                while pending:
+                    timeout = None if is_last else max(0.0, hedge_at - time.monotonic())
+                    done, pending = concurrent.futures.wait(
+                        pending, timeout=timeout, return_when=concurrent.futures.FIRST_COMPLETED
+                    )
+                    if not done:
+                        break
+                    for future in done:
+                        result = future.result()
+                        if result:
+                            return result, proxy_error_seen
+
+            return None, proxy_error_seen
+        finally:
+            with files_lock:
+                abandoned = True
+                losers = [path for path in downloaded if not result or path != result[0]]
+            for path in losers:
+                with contextlib.suppress(OSError):
+                    os.remove(path)
+            executor.shutdown(wait=False, cancel_futures=True)
 
     # First attempt: configured proxy (if any) or direct
     if proxies:
@@ -791,10 +1598,10 @@ def download_audio_pytubefix(video_url: str, output_dir: str | None = None) -> t
                 return result
 
     # All clients failed
-    error_msg = str(last_error).lower() if last_error else ""
-    if "bot" in error_msg or "sign in" in error_msg:
+    error_msg = str(last_error) if last_error else ""
+    if _BLOCKED_ERROR_RE.search(error_msg):
         raise YouTubeBlockedError(f"All pytubefix clients blocked by bot detection: {last_error}")
-    elif "unavailable" in error_msg or "not found" in error_msg:
+    elif _MISSING_ERROR_RE.search(error_msg):
         raise VideoNotFoundError(f"Video not found via pytubefix (tried all clients): {video_id}")
     else:
         raise DownloadError(f"All pytubefix clients failed for {video_id}: {last_error}")
@@ -805,6 +1612,8 @@ def get_metadata_via_ytdlp(url: str) -> dict[str, Any]:
     Get video metadata using yt-dlp --dump-json (no download).
     Works for any URL yt-dlp supports (YouTube, Twitter/X, etc).
     """
+    import yt_dlp
+
     ydl_opts = {
         **get_common_ydl_opts(),
         "skip_download": True,
@@ -820,7 +1629,7 @@ def get_metadata_via_ytdlp(url: str) -> dict[str, Any]:
         ydl_opts["proxy"] = ""  # Disable proxy — Twitter doesn't need it
 
     try:
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+        with _pooled_ydl(ydl_opts) as ydl:
             info = ydl.extract_info(url, download=False)
 
         if info is None:
@@ -843,16 +1652,16 @@ def get_metadata_via_ytdlp(url: str) -> dict[str, Any]:
             "duration": duration,
             "view_count": info.get("view_count"),
             "upload_date": info.get("upload_date"),
-            "description": str(info.get("description") or "")[:500],
+            "description": _take_description(info),
             "platform": platform,
             "original_url": url,
         }
 
     except yt_dlp.utils.DownloadError as e:
-        error_msg = str(e).lower()
-        if "not found" in error_msg or "404" in error_msg:
+        error_msg = str(e)
+        if _NOT_FOUND_ERROR_RE.search(error_msg):
             raise VideoNotFoundError(f"Video not found: {url}")
-        elif "private" in error_msg or "unavailable" in error_msg:
+        elif _UNAVAILABLE_ERROR_RE.search(error_msg):
             raise VideoUnavailableError(f"Video is private or unavailable: {url}")
         else:
             raise DownloadError(f"Failed to get metadata: {e}")
@@ -871,10 +1680,12 @@ def download_audio_twitter(video_url: str, output_dir: str | None = None) -> tup
     Returns:
         Tuple of (audio_file_path, metadata_dict)
     """
-    logger.info(f"[twitter] Downloading audio from: {video_url}")
+    import yt_dlp
+
+    logger.info("[twitter] Downloading audio from: %s", video_url)
 
     if output_dir is None:
-        output_dir = tempfile.mkdtemp()
+        output_dir = make_audio_dir()
 
     # Extract status ID for filename
     status_id = extract_twitter_status_id(video_url) or "twitter_video"
@@ -892,30 +1703,18 @@ def download_audio_twitter(video_url: str, output_dir: str | None = None) -> tup
     ydl_opts.pop("cookiefile", None)
     ydl_opts["proxy"] = ""  # Disable proxy — Twitter doesn't need it
 
-    def _download_with_opts(opts: dict[str, Any]) -> tuple[str, dict[str, Any]]:
+    def _download_with_opts(opts: Mapping[str, Any]) -> tuple[str, dict[str, Any]]:
         with yt_dlp.YoutubeDL(opts) as ydl:
             info = ydl.extract_info(video_url, download=True)
 
             if info is None:
                 raise VideoNotFoundError(f"Video not found: {video_url}")
 
-            # Find the downloaded file
-            audio_path = None
-            for ext in ["m4a", "webm", "opus", "mp4", "mp3", "ogg", "wav"]:
-                potential_path = os.path.join(output_dir, f"{status_id}.{ext}")
-                if os.path.exists(potential_path):
-                    audio_path = potential_path
-                    break
-
-            # Also check for files with the yt-dlp ID
+            # Find the downloaded file, also checking for files with the yt-dlp ID
+            audio_path = _downloaded_filepath(info)
             if audio_path is None:
-                ytdlp_id = info.get("id", "")
-                if ytdlp_id:
-                    for ext in ["m4a", "webm", "opus", "mp4", "mp3", "ogg", "wav"]:
-                        potential_path = os.path.join(output_dir, f"{ytdlp_id}.{ext}")
-                        if os.path.exists(potential_path):
-                            audio_path = potential_path
-                            break
+                stems = (status_id, info["id"]) if info.get("id") else (status_id,)
+                audio_path = _find_audio_file(output_dir, stems)
 
             if audio_path is None:
                 raise DownloadError(f"Failed to download audio from: {video_url}")
@@ -936,7 +1735,7 @@ def download_audio_twitter(video_url: str, output_dir: str | None = None) -> tup
     try:
         return _download_with_opts(ydl_opts)
     except yt_dlp.utils.DownloadError as e:
-        error_msg = str(e).lower()
+        error_msg = str(e)
 
         # Retry without proxy if proxy failed
         if _is_proxy_error(error_msg) and ydl_opts.get("proxy") != "":
@@ -945,11 +1744,11 @@ def download_audio_twitter(video_url: str, output_dir: str | None = None) -> tup
                 return _download_with_opts(_ydl_opts_without_proxy(ydl_opts))
             except yt_dlp.utils.DownloadError as retry_err:
                 e = retry_err
-                error_msg = str(e).lower()
+                error_msg = str(e)
 
-        if "not found" in error_msg or "404" in error_msg:
+        if _NOT_FOUND_ERROR_RE.search(error_msg):
             raise VideoNotFoundError(f"Tweet not found: {video_url}")
-        elif "private" in error_msg or "protected" in error_msg:
+        elif _PROTECTED_ERROR_RE.search(error_msg):
             raise VideoUnavailableError(f"Tweet is private or protected: {video_url}")
         else:
             raise DownloadError(f"Failed to download from Twitter/X: {e}")